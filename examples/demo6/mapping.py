@@ -5,19 +5,15 @@ import os
 import argparse
 from pathlib import Path
 
-project_root = Path(__file__).parent.parent.parent
-sys.path.insert(0, str(project_root))
-
-project_root_parent = Path(
-    __file__
-).parent.parent.parent.parent  # robonix root
-sys.path.insert(0, str(project_root_parent))
+project_root = Path(__file__).resolve().parents[2]
+project_root_parent = project_root.parent  # robonix root
+for path in (str(project_root), str(project_root_parent)):
+    if path not in sys.path:
+        sys.path.insert(0, path)
 
 from robonix.uapi import get_runtime, set_runtime
 from robonix.manager.log import logger, set_log_level
 
-from robonix.skill import *
-
 set_log_level("debug")
 
 
@@ -27,8 +23,7 @@ def init_skill_providers(runtime):
 
     # dump __all__ in robonix.skill to skills list
     try:
-        from robonix.skill import __all__
-        skills = __all__
+        from robonix.skill import __all__ as skills
     except ImportError:
         logger.warning("robonix.skill module not available")
         skills = []
@@ -47,6 +42,7 @@ def create_mapping_entity_builder():
     """创建建图 Entity 并绑定capabilities"""
     def builder(runtime, **kwargs):
         from robonix.uapi.graph.entity import create_root_room, create_controllable_entity
+        from robonix.skill import start_mapping, stop_mapping, save_map
 
         root = create_root_room()
         runtime.set_graph(root)
@@ -1,6 +1,10 @@
 import subprocess
 import os
+import re
+import signal
 import time
+import functools
+import threading
 import psutil
 from robonix.manager.eaios_decorators import eaios
 
@@ -9,6 +13,173 @@ MAPPING_LAUNCH_MAP = {
     "cartographer": "wheeltec_cartographer/cartographer.launch.py",
     "slam_toolbox": "wheeltec_slam_toolbox/online_sync.launch.py"
 }
+# mapping_method -> (launch 路径, 预先拆分好的 "ros2 launch <package> <launch_file>" 参数)
+MAPPING_LAUNCH = {k: (v, tuple(v.split("/"))) for k, v in MAPPING_LAUNCH_MAP.items()}
+
+MAPPING_NODE_NAMES = ("slam_gmapping", "cartographer_node", "slam_toolbox_node")
+# 一次匹配即可判断进程名或命令行是否属于任一建图节点
+MAPPING_NODE_RE = re.compile("|".join(map(re.escape, MAPPING_NODE_NAMES)))
+
+LAUNCH_TIMEOUT = 3.0
+LAUNCH_POLL_INTERVAL = 0.05
+# 首个子进程出现后，launch 需保持运行的时长才视为启动成功
+LAUNCH_SETTLE_TIME = 1.0
+# ppid 快照的有效期为 1 / PPID_MAP_BUCKETS_PER_SEC 秒
+PPID_MAP_BUCKETS_PER_SEC = 2
+LOG_TAIL_BYTES = 4096
+MAP_SAVE_TIMEOUT = 2.0
+MAP_SAVE_POLL_INTERVAL = 0.05
+
+# start_mapping 启动的 launch 进程（各自为独立进程组）: mapping_method -> Popen
+_MAPPING_PROCS = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _ppid_map_cached(t_bucket: int) -> dict:
+    return {
+        p.pid: p.info["ppid"]
+        for p in psutil.process_iter(["ppid"])
+        if p.info["ppid"] is not None
+    }
+
+
+def _ppid_map() -> dict:
+    """
+    返回 {pid: ppid} 快照，同一时间片内的多次调用共享一次 /proc 扫描。
+    """
+    return _ppid_map_cached(int(time.monotonic() * PPID_MAP_BUCKETS_PER_SEC))
+
+
+def _read_log_tail(log_file: str, max_bytes: int = LOG_TAIL_BYTES) -> str:
+    """
+    只读取日志末尾 max_bytes 字节（类似 tail），避免把整个日志读入内存。
+    """
+    with open(log_file, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        f.seek(max(0, size - max_bytes))
+        return f.read().decode("utf-8", errors="replace")
+
+
+def _drain_stderr(pipe, tail: bytearray):
+    """
+    持续读取 launch 进程的 stderr，只保留最后 LOG_TAIL_BYTES 字节，避免管道写满阻塞子进程。
+    """
+    with pipe:
+        while True:
+            chunk = pipe.read(LOG_TAIL_BYTES)
+            if not chunk:
+                break
+            tail += chunk
+            del tail[:-LOG_TAIL_BYTES]
+
+
+def _kill_group(proc: subprocess.Popen):
+    """
+    向 start_mapping 启动的 launch 进程组发送 SIGTERM（进程组号即 launch 的 PID）。
+    """
+    try:
+        os.killpg(proc.pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+
+
+def _wait_for_files(paths, timeout: float) -> bool:
+    """
+    在 timeout 内轮询，所有文件都出现后立即返回 True，超时返回 False。
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        if all(os.path.exists(p) for p in paths):
+            return True
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(MAP_SAVE_POLL_INTERVAL)
+
+
+def _has_children(pid: int) -> bool:
+    """
+    判断进程是否已经派生出子进程。
+    只读取该进程各线程的 /proc/<pid>/task/<tid>/children，避免 psutil 扫描整个 /proc；
+    非 Linux 平台（或内核未提供该文件）回退到缓存的 ppid 快照。
+    """
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as f:
+            if f.read().split():
+                return True
+        tids = os.listdir(f"/proc/{pid}/task")
+    except FileNotFoundError:
+        return pid in _ppid_map().values()
+
+    # 子进程可能由非主线程 fork（如 ros2 launch 的事件循环线程）
+    for tid in tids:
+        if tid == str(pid):
+            continue
+        try:
+            with open(f"/proc/{pid}/task/{tid}/children") as f:
+                if f.read().split():
+                    return True
+        except FileNotFoundError:
+            # 线程已退出
+            continue
+    return False
+
+
+def _find_mapping_node_pids() -> list:
+    """
+    查找进程名或命令行匹配建图节点的 PID。
+    直接读取 /proc/<pid>/comm 和 cmdline，不为每个进程构造 psutil.Process；
+    非 Linux 平台回退到 psutil.process_iter。
+    """
+    try:
+        pids = [int(d) for d in os.listdir("/proc") if d.isdigit()]
+    except FileNotFoundError:
+        return [
+            p.pid
+            for p in psutil.process_iter(["name", "cmdline"])
+            if p.info["name"] in MAPPING_NODE_NAMES
+            or MAPPING_NODE_RE.search(" ".join(p.info["cmdline"] or []))
+        ]
+
+    matched = []
+    for pid in pids:
+        try:
+            with open(f"/proc/{pid}/comm", "rb") as f:
+                name = f.read().rstrip(b"\n").decode("utf-8", errors="replace")
+            if name in MAPPING_NODE_NAMES:
+                matched.append(pid)
+                continue
+            with open(f"/proc/{pid}/cmdline", "rb") as f:
+                cmdline = f.read().replace(b"\0", b" ").decode("utf-8", errors="replace")
+        except OSError:
+            # 进程已退出或无权限读取
+            continue
+        if MAPPING_NODE_RE.search(cmdline):
+            matched.append(pid)
+    return matched
+
+
+def _wait_for_launch(proc: subprocess.Popen, timeout: float = LAUNCH_TIMEOUT) -> bool:
+    """
+    在 timeout 内轮询 launch 进程，出现子进程后再观察 LAUNCH_SETTLE_TIME，
+    期间 launch 未退出且结束时仍有子进程则返回 True；
+    进程提前退出、超时仍无子进程或子进程已全部退出则返回 False。
+    """
+    deadline = time.monotonic() + timeout
+    settled_at = None
+    while True:
+        now = time.monotonic()
+        if proc.poll() is not None:
+            return False
+        if settled_at is None:
+            if _has_children(proc.pid):
+                # 子进程刚 fork 时节点可能尚未加载配置，需等待一段时间确认没有启动即退出
+                settled_at = now + LAUNCH_SETTLE_TIME
+            elif now >= deadline:
+                return False
+        elif now >= settled_at:
+            # ros2 launch 默认不会因节点崩溃而退出，需确认子进程仍然存在
+            return _has_children(proc.pid)
+        time.sleep(LAUNCH_POLL_INTERVAL)
 
 @eaios.api
 def start_mapping(mapping_method: str = "gmapping", config_file: str = None) -> dict:
@@ -21,39 +192,57 @@ def start_mapping(mapping_method: str = "gmapping", config_file: str = None) ->
         { "success": bool, "message": str }
     """
     try :
-        if mapping_method not in  MAPPING_LAUNCH_MAP:
+        launch = MAPPING_LAUNCH.get(mapping_method)
+        if launch is None:
             return{
                 "success":False,
                 "message":f"Unkonwn mapping method: {mapping_method}"
             }
-        launch_path = MAPPING_LAUNCH_MAP[mapping_method]
-        cmd = [
-            "ros2", "launch",
-            *launch_path.split("/") 
-        ]
+        launch_path, launch_args = launch
+
+        running = _MAPPING_PROCS.get(mapping_method)
+        if running is not None and running.poll() is None:
+            return {
+                "success": False,
+                "message": f"Mapping using {mapping_method} is already running, call stop_mapping first",
+            }
+        cmd = ["ros2", "launch", *launch_args]
 
         if config_file:
             cmd += ["--ros-args", "-p", f"config_file:={config_file}"]
         
-        log_file = f"/tmp/{mapping_method}_mapping.log"
-
-        with open(log_file, "w") as f:
-            proc = subprocess.Popen(cmd, stdout=f, stderr=f)
+        # 独立进程组，stop_mapping 可一次 killpg 停掉整棵进程树
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            start_new_session=True,
+            bufsize=0,
+        )
+        stderr_tail = bytearray()
+        drain = threading.Thread(
+            target=_drain_stderr, args=(proc.stderr, stderr_tail), daemon=True
+        )
+        drain.start()
 
-        time.sleep(3)
+        launched = _wait_for_launch(proc)
 
         # 检查进程是否仍在运行
         if proc.poll() is not None:
-            with open(log_file, "r") as f:
-                error_output = f.read()[-500:] 
+            # launch 已退出，清理可能残留的子进程
+            _kill_group(proc)
+            drain.join(timeout=0.2)
+            error_output = bytes(stderr_tail).decode("utf-8", errors="replace")[-500:]
             return {"success": False, "message": f"Launch failed:{error_output}"}
 
-        # 检查是否在 ps 进程列表中
-        p = psutil.Process(proc.pid)
-        children = p.children(recursive=True)
-        if not children:
+        # 检查是否已派生出子进程
+        if not launched:
+            # launch 仍在运行但未成功启动节点，需停掉其进程组，否则 stop_mapping 无法再找到它
+            _kill_group(proc)
             return {"success": False, "message": "No child processes found — launch may have failed"}
 
+        _MAPPING_PROCS[mapping_method] = proc
+
         return {
             "success": True,
             "message": f"Started mapping using {mapping_method}",
@@ -70,8 +259,21 @@ def stop_mapping() -> dict:
     停止所有建图相关节点。
     """
     try:
-        for node in ["slam_gmapping", "cartographer_node", "slam_toolbox_node"]:
-            subprocess.run(["pkill", "-f", node], check=False)
+        # 由 start_mapping 启动的进程组直接整组发送 SIGTERM
+        for proc in _MAPPING_PROCS.values():
+            if proc.poll() is None:
+                _kill_group(proc)
+        _MAPPING_PROCS.clear()
+
+        # 其余方式启动的建图节点：单次遍历进程表，代替逐个节点 fork pkill -f
+        self_pid = os.getpid()
+        for pid in _find_mapping_node_pids():
+            if pid == self_pid:
+                continue
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
+                pass
         return {"success": True, "message": "Stopped all mapping nodes"}
     except Exception as e:
         return {"success": False, "message": str(e)}
@@ -109,8 +311,7 @@ def save_map(map_name: str = "default_map", save_dir: str = "./maps") -> dict:
 
         # 检查返回码
         if result.returncode != 0:
-            with open(log_file, "r") as f:
-                log_tail = f.readlines()[-10:] 
+            log_tail = _read_log_tail(log_file).splitlines(keepends=True)[-10:]
             return {
                 "success": False,
                 "path": "",
@@ -118,14 +319,11 @@ def save_map(map_name: str = "default_map", save_dir: str = "./maps") -> dict:
                 "log_file": log_file
             }
 
-        # 稍微等一下文件写入
-        time.sleep(2)
-
         yaml_path = f"{map_path}.yaml"
         pgm_path = f"{map_path}.pgm"
 
-        # 检查文件是否生成
-        if not os.path.exists(yaml_path) or not os.path.exists(pgm_path):
+        # 等待文件生成，出现即返回，最多等待 MAP_SAVE_TIMEOUT 秒
+        if not _wait_for_files((yaml_path, pgm_path), MAP_SAVE_TIMEOUT):
             return {
                 "success": False,
                 "path": "",
@@ -1,5 +1,12 @@
 import os
+import stat
+import concurrent.futures
 import yaml
+from yaml import load as yaml_load
+try:
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeLoader as _Loader
 from log import logger
 from constant import BASE_PATH
 
@@ -51,7 +58,7 @@ def get_entry_name(entry):
 
     return entry_name, entry_content
 
-def get_node(entry, sub_dir_path, node_type: str = None, entry_content: dict = None) -> BaseNode:
+def get_node(entry, sub_dir_path, node_type: str = None, entry_content: dict = None, dirent: os.DirEntry = None) -> BaseNode:
     """
     Helper function to create a BaseNode object from a directory entry and its description.yml file.
 
@@ -59,40 +66,59 @@ def get_node(entry, sub_dir_path, node_type: str = None, entry_content: dict = N
         entry (str): The name of the directory entry.
         sub_dir_path (str): The path to the subdirectory containing the description.yml file.
         node_type (str): The type of the node (driver, capability, etc.).
+        dirent (os.DirEntry): The scandir entry for sub_dir_path, if the caller already listed its parent.
 
     Returns:
         BaseNode: An instance of BaseNode with details extracted from the description.yml file.
     """
     logger.debug(f"Checking entry: {entry} content {entry_content} in path: {sub_dir_path} for description.yml")
-    # Check if the entry is a directory
-    if os.path.isdir(sub_dir_path):
-        description_file_path = os.path.join(sub_dir_path, "description.yml")
+    # The dirent's cached d_type rules out non-directories without a syscall
+    if dirent is not None and not dirent.is_dir():
+        logger.warning(f"Skipping non-directory entry: {entry}")
+        return None
+
+    description_file_path = os.path.join(sub_dir_path, "description.yml")
+    # A single stat of description.yml answers the common case; the entry
+    # itself is only stat'ed to report why the lookup failed
+    try:
+        st_desc = os.stat(description_file_path)
+    except OSError:
+        st_desc = None
+    if st_desc is not None or dirent is not None:
+        is_dir = True
+    else:
+        try:
+            is_dir = stat.S_ISDIR(os.stat(sub_dir_path).st_mode)
+        except OSError:
+            is_dir = False
 
+    # Check if the entry is a directory
+    if is_dir:
         # Check if description.yml exists in the subdirectory
-        if os.path.exists(description_file_path) and os.path.isfile(
-            description_file_path
-        ):
+        if st_desc is not None and stat.S_ISREG(st_desc.st_mode):
             logger.info(f"Found description.yml in: {sub_dir_path}")
             try:
                 # Read and parse the YAML file
-                with open(description_file_path, "r", encoding="utf-8") as f:
-                    data = yaml.safe_load(f)
-                    params = {}
-                    for k,v in data.get("params", {}).items():
-                        if "default" in v:
-                            params[k] = v.get("default")
-                    params.update(entry_content.get("params", {}) if isinstance(entry_content,dict) else {})
-                    base_info = BaseNode(
-                        cwd=sub_dir_path,
-                        name=data.get("name"),
-                        version=data.get("version"),
-                        author=data.get("author"),
-                        startup_on_boot=data.get("start_on_boot", False),
-                        startup_command=data.get("startup_command", None),
-                        node_type=node_type,
-                        params=params
-                    )
-                    return base_info
+                with open(description_file_path, "rb") as f:
+                    data = yaml_load(f, Loader=_Loader)
+                params = {
+                    k: v["default"]
+                    for k, v in (data.get("params") or {}).items()
+                    if isinstance(v, dict) and "default" in v
+                }
+                if isinstance(entry_content, dict):
+                    params |= entry_content.get("params") or {}
+                base_info = BaseNode(
+                    cwd=sub_dir_path,
+                    name=data.get("name"),
+                    version=data.get("version"),
+                    author=data.get("author"),
+                    startup_on_boot=data.get("start_on_boot", False),
+                    startup_command=data.get("startup_command", None),
+                    node_type=node_type,
+                    params=params
+                )
+                return base_info
             except yaml.YAMLError as e:
                 logger.error(f"Error parsing YAML file '{description_file_path}': {e}")
             except Exception as e:
@@ -123,47 +149,89 @@ def get_node_details(config_path: str) -> list[BaseNode]:
               or no valid description.yml files are found.
     """
     config_path = os.path.join(BASE_PATH, config_path)
-    if not os.path.exists(config_path):
+    try:
+        with open(config_path, "rb") as f:
+            config = yaml_load(f, Loader=_Loader)
+    except FileNotFoundError:
         logger.error(f"Error: The configuration file '{config_path}' does not exist.")
         return []
-    config = {}
+    if not config:
+        logger.warning(f"The configuration file '{config_path}' is empty.")
+        return []
 
-    with open(config_path, "r", encoding="utf-8") as f:
-        config = yaml.safe_load(f)
     all_base_details = []
+    tasks = []
+
+    # One directory listing answers existence and dir-ness for every top-level base
+    try:
+        with os.scandir(BASE_PATH) as it:
+            base_dirents = {dirent.name: dirent for dirent in it}
+    except OSError as e:
+        logger.error(f"An error occurred while accessing '{BASE_PATH}': {e}")
+        return []
+    # Top-level bases reuse the listed DirEntry.path; only nested ones need a join
+    base_paths = {
+        base: base_dirents[base].path if base in base_dirents else os.path.join(BASE_PATH, base)
+        for base in config
+    }
 
     for base, entries in config.items():
         if entries is None:
             logger.error(f"No entries found in {base}")
             continue
-        base_dir_path = os.path.join(BASE_PATH, base)
-        if not os.path.exists(base_dir_path):
+        base_dir_path = base_paths[base]
+        if os.sep in base or (os.altsep and os.altsep in base):
+            # Nested bases (e.g. 'capability/foo') are not in the BASE_PATH listing
+            try:
+                is_dir = stat.S_ISDIR(os.stat(base_dir_path).st_mode)
+            except OSError:
+                is_dir = None
+        else:
+            base_dirent = base_dirents.get(base)
+            is_dir = base_dirent.is_dir() if base_dirent is not None else None
+        if is_dir is None:
             logger.error(
                 f"Error: The 'base' directory was not found at '{base_dir_path}'"
             )
             return []
-        if not os.path.isdir(base_dir_path):
+        if not is_dir:
             logger.error(f"Error: '{base_dir_path}' exists but is not a directory.")
             return []
 
         try:
             # List all entries in the 'base' directory
+            with os.scandir(base_dir_path) as it:
+                entry_dirents = {dirent.name: dirent for dirent in it}
 
             for entry in entries:
                 entry_name, entry_content = get_entry_name(entry)
                 sub_dir_path = os.path.join(base_dir_path, entry_name)
                 logger.info(f"Checking: {entry_name}")
-                base_info = get_node(entry_name, sub_dir_path, base, entry_content)
-                if base_info:
-                    all_base_details.append(base_info)
-                else:
-                    logger.warning(f"No valid BaseNode found for entry_name: {entry_name}")
+                tasks.append(
+                    (entry_name, sub_dir_path, base, entry_content, entry_dirents.get(entry_name))
+                )
         except Exception as e:
             logger.error(f"An error occurred while accessing '{base_dir_path}': {e}")
             return []
 
-    return all_base_details
+    if not tasks:
+        return all_base_details
+
+    # Entries are independent, so stat/read/parse them concurrently; map() keeps config order
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(32, len(tasks))) as ex:
+            results = list(ex.map(lambda task: get_node(*task), tasks))
+    except Exception as e:
+        logger.error(f"An error occurred while loading node descriptions: {e}")
+        return []
+
+    for (entry_name, *_), base_info in zip(tasks, results):
+        if base_info:
+            all_base_details.append(base_info)
+        else:
+            logger.warning(f"No valid BaseNode found for entry_name: {entry_name}")
 
+    return all_base_details
 
 if __name__ == "__main__":
     import sys